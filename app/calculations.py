@@ -10,15 +10,15 @@ Purpose: The contents of this file are to perform various calculations
 
 # Standard library imports
 import re
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, List, Optional, Union
 import numpy as np
 import pandas as pd
 from thefuzz import fuzz, process
 
 # Local/application-specific imports
 from app.formatting import (
+    get_camera_lookup,
     get_camera_set,
-    find_verkada_camera,
     sanitize_customer_data,
     get_manufacturer_set,
 )
@@ -30,6 +30,8 @@ from app import (
     Connector,
 )
 
+CAMERA_SPECS_FILE = "./Camera Specs.csv"
+
 
 @time_function
 def identify_model_column_name(
@@ -146,18 +148,12 @@ def get_camera_count(
             customer_list.iloc[:, count_column_index], errors="coerce"
         ).fillna(1)
 
-        camera_counts_dict = {
-            name: count_column.iloc[group].sum()
-            for name, group in results.groupby("name").groups.items()
-        }
-        # Convert dictionary to DataFrame and merge
-        camera_counts = pd.DataFrame(
-            list(camera_counts_dict.items()), columns=["name", "count"]
-        )
-        results = results.merge(camera_counts, on="name", how="left")
+        # Sum the counts per camera name in one hashed pass
+        camera_counts = count_column.groupby(results["name"]).sum()
+        results["count"] = results["name"].map(camera_counts)
     else:
         log.info("No Camera Count Found, calculating using model names")
-        results["count"] = results.groupby("name")["name"].transform("count")
+        results["count"] = results["name"].map(results["name"].value_counts())
 
         # Keep only unique camera names
     results = results.drop_duplicates(["name"])
@@ -167,6 +163,11 @@ def get_camera_count(
         (results["name"].notna()) | (results["match_type"] != "empty")
     ]
 
+    # Counts are whole cameras, so store them as integers once, but keep
+    # fractional counts as given rather than silently truncating them
+    if (results["count"] % 1 == 0).all():
+        return results.astype({"count": "int64"})
+    log.warning("Camera counts are not all whole numbers, keeping them.")
     return results
 
 
@@ -174,6 +175,7 @@ def get_camera_match(
     raw_customer_list: pd.DataFrame,
     verkada_cameras: List[CompatibleModel],
     model_column: Optional[Union[int, str]] = None,
+    manufacturers: Optional[FrozenSet[str]] = None,
 ) -> pd.DataFrame:
     """Match customer cameras against a list of known Verkada cameras.
 
@@ -181,6 +183,8 @@ def get_camera_match(
         raw_customer_list (pd.DataFrame): The list of known cameras.
         verkada_cameras (List[CompatibleModel]): The list of known cameras.
         model_column (Optional[int]): The column index of the known camera model.
+        manufacturers (Optional[FrozenSet[str]]): The prebuilt set of
+            Verkada manufacturers. Built from verkada_cameras if omitted.
 
     Returns:
         pd.DataFrame: The matched cameras with count.
@@ -237,10 +241,9 @@ def get_camera_match(
             }
         )
 
-    customer_list = sanitize_customer_data(
-        raw_customer_list,
-        get_manufacturer_set(verkada_cameras),
-    )
+    if manufacturers is None:
+        manufacturers = get_manufacturer_set(verkada_cameras)
+    customer_list = sanitize_customer_data(raw_customer_list, manufacturers)
     if model_column is None:
         camera_column = identify_model_column_name(
             customer_list, verkada_cameras
@@ -263,7 +266,12 @@ def get_camera_match(
             raise KeyError(f"Column '{camera_column}' not found in DataFrame")
         model_data = customer_list[camera_column]
     verkada_cameras_list = get_camera_set(verkada_cameras)
-    result = model_data.apply(match_camera)
+
+    # Lists repeat the same models many times, so score each distinct
+    # value once and spread the matches back over the rows it came from
+    codes, unique_models = pd.factorize(model_data, use_na_sentinel=False)
+    result = pd.Series(unique_models).apply(match_camera).iloc[codes]
+    result.index = model_data.index
     result = get_camera_count(raw_customer_list, result)
     log.info("First 10 Matched Results: \n '%s'", result.head(10).to_string())
 
@@ -275,22 +283,23 @@ def get_camera_match(
         "unsupported": 4,
     }
 
-    # Sort the results by match type using the defined order
-    result["match_type_order"] = result["match_type"].map(match_order)
-    sorted_result = result.sort_values(by="match_type_order").drop(
-        columns=["match_type_order"]
+    # Sort the results by match type using the defined order, ranking
+    # the column in place of adding and then dropping a helper column
+    return result.sort_values(
+        by="match_type", key=lambda match_type: match_type.map(match_order)
     )
-    return sorted_result
 
 
 @time_function
 def compile_camera_mp_channels(
     verkada_camera_list: List[CompatibleModel],
+    camera_specs_file: str = CAMERA_SPECS_FILE,
 ) -> List[CompatibleModel]:
     """Compile camera models.
 
     Args:
         verkada_camera_list (List[CompatibleModel]): The list of known cameras.
+        camera_specs_file (str): The path to the camera specs CSV file.
 
     Returns:
         pd.DataFrame: A DataFrame containing camera specifications for
@@ -310,18 +319,23 @@ def compile_camera_mp_channels(
         11        Avigilon   1.0-H3-DC1  1.0       1.0
     """
 
-    camera_map = pd.read_csv("./Camera Specs.csv")
-    # Iterate through each row in the DataFrame
-    for _, row in camera_map.iterrows():
-        model_name = row["Model Name"]
-        mp = row["MP"]
-        channels = row["Channels"]
-        # Check if the name in the DataFrame matches any CompatibleModel
-        for model in verkada_camera_list:
-            if model.model_name.lower() == model_name.lower():
-                # Update the channels based on the count
-                model.channels += channels
-                model.mp += mp
+    camera_map = pd.read_csv(camera_specs_file)
+
+    # Group the compatible models by name so each spec row is matched
+    # with one lookup rather than a scan of the whole list
+    models_by_name: Dict[str, List[CompatibleModel]] = {}
+    for model in verkada_camera_list:
+        models_by_name.setdefault(model.model_name.lower(), []).append(model)
+
+    # Iterate through each row as a plain tuple of the needed columns
+    for model_name, mp, channels in camera_map[
+        ["Model Name", "MP", "Channels"]
+    ].itertuples(index=False, name=None):
+        # Update every CompatibleModel sharing the name in the DataFrame
+        for model in models_by_name.get(model_name.lower(), ()):
+            # Update the channels based on the count
+            model.channels += channels
+            model.mp += mp
     return verkada_camera_list
 
 
@@ -350,7 +364,7 @@ def compile_low_mp_cameras() -> pd.DataFrame:
         11        Avigilon   1.0-H3-DC1  1.0       1.0
     """
 
-    camera_map = pd.read_csv("./Camera Specs.csv")
+    camera_map = pd.read_csv(CAMERA_SPECS_FILE)
     return camera_map[camera_map["MP"] <= 5]
 
 
@@ -379,7 +393,7 @@ def compile_high_mp_cameras() -> pd.DataFrame:
         8             Ava   360-W-30  12.0       1.0
     """
 
-    camera_map = pd.read_csv("./Camera Specs.csv")
+    camera_map = pd.read_csv(CAMERA_SPECS_FILE)
     return camera_map[camera_map["MP"] > 5]
 
 
@@ -535,18 +549,23 @@ def count_mp(
     low_count = 0
     high_count = 0
 
-    # Iterate through each row in the DataFrame
-    for _, row in camera_dataframe.iterrows():
-        if row["verkada_model"] is not None:
-            # Find the corresponding camera model in the list
-            if camera_model := find_verkada_camera(
-                str(row["verkada_model"]), verkada_camera_list
-            ):
-                # Assuming camera_model has an attribute 'mp' for megapixels
-                if camera_model.mp <= 5:
-                    low_count += int(row["count"])
-                else:
-                    high_count += int(row["count"])
+    # Total the cameras per model first so each model is looked up once,
+    # unmatched rows without a model are dropped by the grouping
+    model_counts = camera_dataframe.groupby("verkada_model", sort=False)[
+        "count"
+    ].sum()
+
+    # Model names are stored lowercase, so a name index gives the same
+    # model the case-insensitive search through the list used to find
+    models_by_name = get_camera_lookup(verkada_camera_list)
+    for verkada_model, count in model_counts.items():
+        # Find the corresponding camera model in the list
+        if camera_model := models_by_name.get(str(verkada_model).lower()):
+            # Assuming camera_model has an attribute 'mp' for megapixels
+            if camera_model.mp <= 5:
+                low_count += int(count)
+            else:
+                high_count += int(count)
 
     return [low_count, high_count]
 
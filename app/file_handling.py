@@ -4,11 +4,17 @@ Co-Author: Ian Young
 Purpose: The contents of this file are to perform file handling.
 """
 
-from typing import List
+import os
+import pickle
+from typing import Any, Hashable, List
 
 import pandas as pd
 
-from app import CompatibleModel, time_function
+from app import CompatibleModel, log, time_function
+from app.calculations import CAMERA_SPECS_FILE, compile_camera_mp_channels
+
+# Bump when the compiled models change shape so stale pickles are rebuilt
+COMPATIBILITY_CACHE_VERSION = 2
 
 
 @time_function
@@ -28,15 +34,112 @@ def parse_hardware_compatibility_list(filename: str) -> List[CompatibleModel]:
         list: A list of CompatibleModel objects created from the CSV data.
     """
     compatible_models = []
-    df = pd.read_csv(filename, skiprows=5, header=None, encoding="UTF-8")
+    # Only the first four columns are used, and all of them hold text,
+    # so skip reading anything else and inferring their types. Empty
+    # cells, such as models without notes, are read as empty strings.
+    df = pd.read_csv(
+        filename,
+        skiprows=5,
+        header=None,
+        usecols=range(4),
+        dtype=str,
+        encoding="UTF-8",
+    ).fillna("")
 
     # Read the rest of the rows and create CompatibleModel objects
-    for _, row in df.iterrows():
-        model = CompatibleModel(row[1].lower(), row[0], row[2], row[3])
+    for manufacturer, model_name, firmware, notes in df.itertuples(
+        index=False, name=None
+    ):
+        model = CompatibleModel(
+            model_name.lower(), manufacturer, firmware, notes
+        )
         compatible_models.append(model)
     return compatible_models
 
 
+def read_cache(cache_file: str, source_key: Hashable) -> Any:
+    """Load a value pickled by write_cache if it is still current.
+
+    Args:
+        cache_file (str): The path of the pickle file.
+        source_key (Hashable): The key describing the files the value
+            was computed from.
+
+    Returns:
+        Any: The cached value, or None if the pickle is missing,
+            unreadable or was stored under a different key.
+    """
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        with open(cache_file, "rb") as file:
+            cached_key, cached_value = pickle.load(file)
+    # Unpickling can fail in many ways, such as on a class that has
+    # since been moved or renamed, and any of them is just a cache miss
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        log.warning("Ignoring unreadable cache %s: %s", cache_file, error)
+        return None
+    return cached_value if cached_key == source_key else None
+
+
+def write_cache(cache_file: str, source_key: Hashable, value: Any) -> None:
+    """Pickle a value together with the key it was computed from.
+
+    Failing to write the cache is logged and otherwise ignored, since
+    the value can always be computed again.
+
+    Args:
+        cache_file (str): The path of the pickle file.
+        source_key (Hashable): The key describing the files the value
+            was computed from.
+        value (Any): The value to store.
+    """
+    try:
+        directory = os.path.dirname(cache_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(cache_file, "wb") as file:
+            pickle.dump((source_key, value), file, pickle.HIGHEST_PROTOCOL)
+    except OSError as error:
+        log.warning("Unable to write cache %s: %s", cache_file, error)
+
+
+@time_function
+def load_compatibility_list(filename: str) -> List[CompatibleModel]:
+    """Load the compiled compatibility list, reusing a pickled copy.
+
+    The pickle stored next to the compatibility list records the
+    modification time and size of both CSV files it was compiled from.
+    Parsing the hardware compatibility list and compiling the camera
+    specs only happens when either file no longer matches that record.
+    Otherwise, the previously compiled list is loaded from the pickle.
+
+    Args:
+        filename (str): The path to the CSV file containing compatibility
+            data.
+
+    Returns:
+        List[CompatibleModel]: The compatible models with their megapixel
+            and channel values compiled.
+    """
+    cache_file = f"{os.path.splitext(filename)[0]}.pkl"
+    source_key = (COMPATIBILITY_CACHE_VERSION,) + tuple(
+        (stat.st_mtime_ns, stat.st_size)
+        for stat in (os.stat(filename), os.stat(CAMERA_SPECS_FILE))
+    )
+
+    cached_models = read_cache(cache_file, source_key)
+    if cached_models is not None:
+        return cached_models
+
+    # Compile from the same specs file the cache is keyed on
+    compatible_models = compile_camera_mp_channels(
+        parse_hardware_compatibility_list(filename), CAMERA_SPECS_FILE
+    )
+    write_cache(cache_file, source_key, compatible_models)
+    return compatible_models
+
+
 @time_function
 def parse_customer_list(filename: str) -> pd.DataFrame:
     """Read a CSV file and transpose its rows into columns.
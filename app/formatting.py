@@ -4,16 +4,14 @@ Purpose: The contents of this file are to perform formatting for the
     customer camera file.
 """
 
-# pylint: disable=ungrouped-imports
+# pylint: disable=ungrouped-imports,import-outside-toplevel
 
 import os
 import re
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from collections import Counter
+from operator import itemgetter
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Set, Tuple
 import pandas as pd
-from nltk.corpus import words
-from nltk.downloader import download
-from pandas import Series
 from tabulate import tabulate
 
 from app import CompatibleModel, Connector, logging_decorator
@@ -35,84 +33,80 @@ def get_camera_set(verkada_list: List[CompatibleModel]) -> Set[str]:
     return {""}
 
 
-def get_manufacturer_set(verkada_list: List[CompatibleModel]) -> Set[str]:
+def get_manufacturer_set(
+    verkada_list: List[CompatibleModel],
+) -> FrozenSet[str]:
     """Retrieve a set of camera manufacturer names from compatible models.
 
+    The set is immutable so it can be built once per compatibility list
+    and shared between runs.
+
     Args:
         verkada_list (List[CompatibleModel]): List of compatible models.
 
     Returns:
-        Set[str]: Set of manufacturer names.
+        FrozenSet[str]: Set of manufacturer names.
     """
     if isinstance(verkada_list, list):
-        return {model.manufacturer.lower() for model in verkada_list}
-    return {""}
+        return frozenset(model.manufacturer.lower() for model in verkada_list)
+    return frozenset({""})
 
 
-@logging_decorator
-def find_verkada_camera(
-    verkada_model: str, verkada_camera_list: List[CompatibleModel]
-) -> Optional[CompatibleModel]:
-    """Find a matching camera by its name.
+def get_camera_lookup(
+    verkada_list: List[CompatibleModel],
+) -> Dict[str, CompatibleModel]:
+    """Index compatible models by their model name.
+
+    The first model listed under each name is kept, the same one a
+    linear search through the list would find.
 
     Args:
-        camera_name (str): The name of the camera to search for.
-        verkada_cameras (List[CompatibleModel]): List of compatible
-            models.
+        verkada_list (List[CompatibleModel]): List of compatible models.
 
     Returns:
-        Optional[CompatibleModel]: The matching camera object if found,
-            otherwise None.
+        Dict[str, CompatibleModel]: Compatible models keyed by name.
     """
-    return next(
-        (
-            camera
-            for camera in verkada_camera_list
-            if camera.model_name.lower() == verkada_model.lower()
-        ),
-        None,
-    )
+    lookup: Dict[str, CompatibleModel] = {}
+    for model in verkada_list:
+        lookup.setdefault(model.model_name, model)
+    return lookup
+
 
+def get_verkada_details_frame(
+    verkada_list: List[CompatibleModel],
+) -> pd.DataFrame:
+    """Tabulate the details of each compatible model for joining.
 
-def list_verkada_camera_details(
-    camera_name: Series, verkada_list: List[CompatibleModel]
-) -> List[str]:
-    """Find a matching camera by its name.
+    Holds one row per model name, so results can be joined against it
+    in one pass instead of searching the list for each result.
 
     Args:
-        camera_name (str): Name of camera.
         verkada_list (List[CompatibleModel]): List of compatible models.
 
     Returns:
-        List[str]: Matching camera model.
+        pd.DataFrame: Model, manufacturer, minimum firmware and notes,
+            keyed by the first model with each name.
     """
-    # Return with next to save memory
-    return next(
-        (
+    return pd.DataFrame(
+        [
             (
-                [
-                    model.model_name,
-                    model.manufacturer,
-                    model.minimum_supported_firmware_version,
-                    "",
-                ]
-                if model.notes == "nan"
-                else [
-                    model.model_name,
-                    model.manufacturer,
-                    model.minimum_supported_firmware_version,
-                    model.notes,
-                ]
+                model.model_name,
+                model.manufacturer,
+                model.minimum_supported_firmware_version,
+                model.notes,
             )
             for model in verkada_list
-            if model.model_name == camera_name
-        ),
-        ["", "", "", ""],
-    )
+        ],
+        columns=["verkada_model", "manufacturer", "firmware", "notes"],
+    ).drop_duplicates("verkada_model")
 
 
 def ensure_nltk_words_loaded():
     """Ensure the NLTK words corpus is downloaded and available."""
+    # NLTK is slow to import and only needed once a list is sanitized
+    from nltk.corpus import words
+    from nltk.downloader import download
+
     try:
         if not os.path.isdir(NLTK_DATA_PATH):
             download("words", download_dir=NLTK_DATA_PATH)
@@ -130,6 +124,8 @@ def prepare_customer_list(customer_list: pd.DataFrame) -> pd.DataFrame:
 
 def extract_english_words() -> Set[str]:
     """Extract English words from NLTK corpus."""
+    from nltk.corpus import words
+
     ensure_nltk_words_loaded()
     return {word.lower() for word in words.words()}
 
@@ -159,7 +155,10 @@ def compile_regex_patterns():
 
 
 def remove_keywords(
-    value: str, dictionary: Set[str], english_words: Set[str], patterns: dict
+    value: str,
+    dictionary: AbstractSet[str],
+    english_words: Set[str],
+    patterns: dict,
 ) -> str:
     """Remove unwanted keywords from a value."""
     if not value:
@@ -233,7 +232,7 @@ def remove_duplicates_from_row(row) -> pd.Series:
 
 
 def sanitize_customer_data(
-    customer_list: pd.DataFrame, dictionary: Set[str]
+    customer_list: pd.DataFrame, dictionary: AbstractSet[str]
 ) -> pd.DataFrame:
     """Sanitize Customer List."""
     customer_list = prepare_customer_list(customer_list)
@@ -292,6 +291,22 @@ def tabulate_data(data: List[List[str]]) -> None:
     print(tabulate(combined_data, headers=headers, tablefmt="pipe"))
 
 
+def count_connector_recommendation(
+    recommendations: List[Connector],
+) -> List[Tuple[str, int]]:
+    """Count how many of each Command Connector are recommended.
+
+    Args:
+        recommendations (List[Connector]): The recommended connectors.
+
+    Returns:
+        List[Tuple[str, int]]: Each connector name with its count, in
+            the order the connectors were first recommended.
+    """
+    # Count occurrences of each CC by name in a single pass
+    return list(Counter(map(itemgetter("name"), recommendations)).items())
+
+
 @logging_decorator
 def print_connector_recommendation(recommendations: List[Connector]):
     """
@@ -314,15 +329,7 @@ def print_connector_recommendation(recommendations: List[Connector]):
         ])
     """
 
-    # Count occurrences of each CC automatically creating keys of 0
-    device_count: Dict[str, int] = defaultdict(int)
-
-    for device in recommendations:
-        # Add device to dictionary if it doesn't exist and/or increment by one
-        device_count[device["name"]] += 1
-
-    # Convert dict to tuple
-    device_table = list(device_count.items())
+    device_table = count_connector_recommendation(recommendations)
 
     # NOTE: Uncomment to print recommendations to terminal
     print(
@@ -335,15 +342,28 @@ def print_connector_recommendation(recommendations: List[Connector]):
     return device_table
 
 
-def export_to_csv(df: pd.DataFrame, path: str) -> None:
+def export_to_csv(
+    df: pd.DataFrame, path: str, csv_text: Optional[str] = None
+) -> Optional[str]:
     """Export a dataframe to a CSV file.
 
     Args:
         df (pd.DataFrame): The dataframe to export.
         path (str): The path to export the dataframe to.
+        csv_text (Optional[str]): The dataframe already serialized by an
+            earlier export, written as is instead of serializing again.
+
+    Returns:
+        Optional[str]: The CSV text written, for reuse by a later
+            export of the same dataframe.
     """
-    if path is not None and path != "":
-        df.to_csv(path, index=False)
+    # A cancelled save dialog can hand back an empty tuple, not a string
+    if path:
+        if csv_text is None:
+            csv_text = df.to_csv(index=False)
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(csv_text)
+    return csv_text
 
     # NOTE: Uncomment to output to CSV
     # pd.DataFrame(device_count).to_csv("connector_recommendations.csv")
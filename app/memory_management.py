@@ -22,6 +22,8 @@ class MemoryStorage:
         excess_channels: The number of excess channels available.
         compatible: The compatible cameras for the memory management
             system.
+        cache_key: The inputs the stored recommendations were computed
+            from.
     """
 
     def __init__(self) -> None:
@@ -42,6 +44,36 @@ class MemoryStorage:
         self.excess_channels = None
         self.compatible = None
         self.results = None
+        self.cache_key = None
+
+    def set_cache_key(self, cache_key):
+        """Sets the key describing the inputs of the stored results.
+
+        This method records the inputs that the current recommendations
+        and excess channels were calculated from, so an identical run can
+        reuse them instead of recalculating.
+
+        Args:
+            self: The instance of the class.
+            cache_key: A hashable value describing the calculation inputs.
+
+        Returns:
+            None
+        """
+        self.cache_key = cache_key
+
+    def matches_cache_key(self, cache_key):
+        """Checks if the stored results were computed from the given inputs.
+
+        Args:
+            self: The instance of the class.
+            cache_key: A hashable value describing the calculation inputs.
+
+        Returns:
+            bool: True if the stored results match the given key, otherwise
+                False.
+        """
+        return self.cache_key is not None and self.cache_key == cache_key
 
     def set_results(self, results):
         """Sets the results of the camera match algorithm
@@ -12,7 +12,7 @@ import pandas as pd
 from tabulate import tabulate
 
 from app import CompatibleModel, log
-from app.formatting import list_verkada_camera_details, strip_ansi_codes
+from app.formatting import get_verkada_details_frame, strip_ansi_codes
 
 
 def print_results(
@@ -37,25 +37,26 @@ def print_results(
     log.debug("Run calculations: %s", (not memory.has_text_widget() or change))
 
     if not memory.has_text_widget() or change:
-        output = []
-
-        for _, row in results.iterrows():
-            camera_data = {
-                "camera_name": row["name"],
-                "camera_count": row["count"],
-                "match_type": row["match_type"],
-                "verkada_details": list_verkada_camera_details(
-                    row["verkada_model"], verkada_list
-                ),
-            }
-            output.append(
-                [
-                    camera_data["camera_name"],
-                    camera_data["camera_count"],
-                    camera_data["match_type"],
-                    *camera_data["verkada_details"],
-                ]
-            )
+        # Join every result to its Verkada details at once rather than
+        # scanning the compatibility list for each row
+        merged = results.merge(
+            get_verkada_details_frame(verkada_list),
+            on="verkada_model",
+            how="left",
+        )
+        details_columns = [
+            "verkada_model",
+            "manufacturer",
+            "firmware",
+            "notes",
+        ]
+        # Blank the details of unmatched rows
+        merged[details_columns] = merged[details_columns].fillna("")
+        output = list(
+            merged[
+                ["name", "count", "match_type", *details_columns]
+            ].itertuples(index=False, name=None)
+        )
 
         output.sort(key=lambda x: x[2], reverse=False)
 
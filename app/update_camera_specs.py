@@ -1,34 +1,29 @@
 """Module for downloading HCL files and updating specs."""
 
-# pylint: disable=ungrouped-imports
+# pylint: disable=ungrouped-imports,import-outside-toplevel,import-error
 
 import os
 import time
+from importlib.util import find_spec
 from subprocess import check_call
 from sys import executable
 from typing import Optional
 
-try:
-    import pandas as pd
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.support.ui import WebDriverWait
-except ImportError as e:
-    package_name = str(e).split()[-1]
-    check_call([executable, "-m", "pip", "install", package_name])
-    # Import again after installation
-    import pandas as pd
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.support.ui import WebDriverWait
+import pandas as pd
 
 from app import logging_decorator, time_function
 
 
+def _ensure_selenium() -> None:
+    """Install selenium if it is not already available.
+
+    Selenium is only needed to download the HCL file, so it is imported
+    when a download starts rather than when this module is loaded.
+    """
+    if find_spec("selenium") is None:
+        check_call([executable, "-m", "pip", "install", "selenium"])
+
+
 @time_function
 def download_hcl(url: str) -> Optional[str]:
     """
@@ -40,6 +35,10 @@ def download_hcl(url: str) -> Optional[str]:
     Returns:
         Optional[str]: The path to the downloaded file, or None if download failed.
     """
+    _ensure_selenium()
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     download_dir = os.path.abspath(os.path.join(os.getcwd(), ".."))
 
     chrome_options = Options()
@@ -76,6 +75,10 @@ def download_csv(driver, url, download_dir):
         str: The path to the downloaded CSV file if successful, otherwise
             None.
     """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     driver.get(url)
     button_xpath = (
         "//button[contains(@class, 'hidden') and contains(@class, 'md:block')]"
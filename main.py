@@ -6,8 +6,12 @@ Purpose: Import a list of third-party cameras and return
 """
 
 # pylint: disable=attribute-defined-outside-init,too-many-instance-attributes
+# pylint: disable=too-many-lines
 # Standard library imports
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from tkinter import filedialog
 
 # Third-party imports
@@ -15,51 +19,131 @@ import customtkinter as ctk
 import pandas as pd
 
 # Local imports
-from app.calculations import compile_camera_mp_channels, get_camera_match
-from app.file_handling import (
-    parse_hardware_compatibility_list,
-    parse_customer_list,
-)
+from app.calculations import get_camera_match
+from app.file_handling import load_compatibility_list, parse_customer_list
 from app.formatting import (
-    list_verkada_camera_details,
+    count_connector_recommendation,
     export_to_csv,
+    get_camera_lookup,
+    get_manufacturer_set,
 )
+from app import log
 from app.memory_management import MemoryStorage
 from app.recommend import recommend_connectors
 
 ctk.set_appearance_mode("System")
 ctk.set_default_color_theme("blue")
 
+DEFAULT_ROW_COLORS = ("#ffffff", "#000000")
 
-def _format_recommendations(recommendations, memory):
-    formatted = ["\nRecommended Connectors:"]
-    formatted.extend(f"  - {rec[0]}: {rec[1]}" for rec in recommendations)
-    formatted.append(f"\nExcess Channels: {memory.get_excess_channels()}")
-    return formatted
 
+class _RowColors(dict):
+    """Color table that falls back to the default row colors."""
 
-def _get_color_for_match_type(match_type: str) -> tuple:
-    """
-    Get the color scheme for a given match type.
+    def __missing__(self, match_type):
+        return DEFAULT_ROW_COLORS
 
-    Args:
-        match_type: Type of camera match
 
-    Returns:
-        tuple: Pair of colors for normal and hover states
-    """
-    color_map = {
+# Row colors for each match type, built once rather than on every row
+MATCH_TYPE_COLORS = _RowColors(
+    {
         "exact": ("#a0e77d", "#61724C"),  # Green
         "identified": ("#82b6d9", "#4C4E72"),  # Blue
         "potential": ("#ebd671", "#726E4C"),  # Yellow
         "unsupported": ("#ef8677", "#724C4C"),  # Red
     }
-    return color_map.get(match_type, ("#ffffff", "#000000"))
+)
+ROW_TEXT_COLORS = ("#000000", "#ffffff")
+HEADER_COLORS = ("gray85", "gray20")
+MATCH_POLL_MS = 50  # How often to check on a running match
+ROW_BATCH_SIZE = 200  # Camera rows created per pass of the event loop
+
+
+def _match_customer_file(file_path, verkada_list, model_column, manufacturers):
+    """
+    Parse and match a customer camera list away from the Tk thread.
+
+    Args:
+        file_path: Path to the customer CSV file
+        verkada_list: Compiled Verkada compatibility list
+        model_column: Column to force as the model column, if any
+        manufacturers: Prebuilt set of Verkada manufacturers
+
+    Returns:
+        DataFrame of matched cameras, or None if no model column was found
+    """
+    return get_camera_match(
+        parse_customer_list(file_path),
+        verkada_list,
+        model_column,
+        manufacturers,
+    )
+
+
+def _recommend_for_cameras(retention, camera_list, verkada_list):
+    """
+    Work out connector recommendations away from the Tk thread.
+
+    Args:
+        retention: Required storage retention in days
+        camera_list: DataFrame of matched cameras
+        verkada_list: Compiled Verkada compatibility list
+
+    Returns:
+        MemoryStorage holding the recommendations and excess channels
+    """
+    memory = MemoryStorage()
+    recommend_connectors(True, retention, camera_list, verkada_list, memory)
+    return memory
+
+
+def _create_info_label(frame):
+    """
+    Create the label used to show text in an information panel.
+
+    Args:
+        frame: The information panel frame to hold the label
+
+    Returns:
+        CTkLabel: The label, not yet packed
+    """
+    return ctk.CTkLabel(
+        frame, text="", anchor="w", justify="left", wraplength=400
+    )
+
+
+def _format_recommendations(recommendations, memory):
+    connectors = "\n".join(
+        f"  - {name}: {count}" for name, count in recommendations
+    )
+    return (
+        f"\n\nRecommended Connectors:\n{connectors}"
+        f"\n\nExcess Channels: {memory.get_excess_channels()}"
+    )
 
 
 class App(ctk.CTk):
     """A class to manage the GUI for Command Connector Compatibility Calculator."""
 
+    # Fixed layouts of the information panels
+    GENERAL_INFO_FORMAT = (
+        "File: {filename} ({filesize:.2f} KB)"
+        "\nTotal Cameras: {total_cameras}"
+        "\nCamera Breakdown:"
+        "\n  - Exact Matches: {exact_matches}"
+        "\n  - Identified Matches: {identified_matches}"
+        "\n  - Potential Matches: {potential_matches}"
+        "\n  - Unsupported Matches: {unsupported_matches}"
+    )
+    CAMERA_DETAILS_FORMAT = "Name: {}\nCount: {}\nMatch Type: {}"
+    VERKADA_DETAILS_FORMAT = (
+        "\nVerkada Verified Details:"
+        "\n  - Name: {}"
+        "\n  - Manufacturer: {}"
+        "\n  - Min. Firmware: {}"
+        "\n  - Notes: {}"
+    )
+
     def __init__(self):
         super().__init__()
         self.force_column_value = None
@@ -74,13 +158,40 @@ class App(ctk.CTk):
 
     def _init_variables(self):
         self.file_paths = []
+        self.file_names = {}
+        self.file_sizes = {}
         self.command_connector_compatibility_list = (
             "Verkada Command Connector Compatibility.csv"
         )
         self.verkada_compatibility_list = None
+        self.verkada_manufacturers = None
+        self.verkada_models = {}
         self.current_camera_list = None
+        self.current_cameras_by_name = {}
+        self.current_file_path = None
+        self._last_run_key = None
+        self._pending_run_key = None
+        self._match_future = None
+        self._match_retry = None
+        self._compatibility_mtime = None
+        self._compatibility_future = None
+        self._match_cache = {}
+        self._recommendation_cache = {}
+        self._recommendation_futures = {}
+        self._populate_job = None
+        self._camera_rows = []
+        self._file_buttons = []
+        self._export_text = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Created once files are selected, sized to the selection
+        self._match_pool = None
+        self._match_pool_size = 0
+        self._prematch_futures = {}
+        self._general_info_text = None
+        self._camera_details_text = None
+        self.memory = MemoryStorage()
         self.recommend_cc_value = 0
-        self.force_column_value = 0
+        self.force_column_value = None
         self.current_file_info = {}
         self._init_ui_components()
 
@@ -100,20 +211,72 @@ class App(ctk.CTk):
         self.info_panel = None
         self.general_info_label = None
         self.general_info_frame = None
+        self.general_info_content = None
         self.camera_details_label = None
         self.camera_details_frame = None
+        self.camera_details_content = None
 
     def _init_window(self):
         self.title("Command Connector Compatibility Calculator")
         self.geometry(f"{1100}x{580}")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
+    def _on_close(self):
+        """Drop queued background work so the app can exit right away."""
+        # Exiting would otherwise wait until every file queued for
+        # matching in advance has been matched
+        self._shutdown_match_pool()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     def _load_compatibility_list(self):
-        self.verkada_compatibility_list = compile_camera_mp_channels(
-            parse_hardware_compatibility_list(
-                self.command_connector_compatibility_list
+        # Read the list in the background so the window can paint first
+        mtime = os.path.getmtime(self.command_connector_compatibility_list)
+        self._compatibility_future = self._executor.submit(
+            load_compatibility_list, self.command_connector_compatibility_list
+        )
+        self.after(
+            MATCH_POLL_MS,
+            self._finish_loading_compatibility_list,
+            self._compatibility_future,
+            mtime,
+        )
+
+    def _finish_loading_compatibility_list(self, future, mtime):
+        """
+        Swap in a background compatibility list load once it completes.
+
+        Args:
+            future: Future of the running load
+            mtime: Modification time of the list when the load started
+        """
+        if not future.done():
+            self.after(
+                MATCH_POLL_MS,
+                self._finish_loading_compatibility_list,
+                future,
+                mtime,
             )
+            return
+
+        self._compatibility_future = None
+        # Record the attempt either way so a bad list is not reread
+        # until it is edited again
+        self._compatibility_mtime = mtime
+        try:
+            compatibility_list = future.result()
+        # Keep checking against the previous list whatever went wrong
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Could not load the compatibility list.")
+            return
+        self.verkada_compatibility_list = compatibility_list
+        self.verkada_manufacturers = get_manufacturer_set(
+            self.verkada_compatibility_list
+        )
+        self.verkada_models = get_camera_lookup(
+            self.verkada_compatibility_list
         )
 
     def _create_info_panel(self):
@@ -131,7 +294,7 @@ class App(ctk.CTk):
         self.general_info_label = ctk.CTkLabel(
             self.info_panel,
             text="General Information",
-            fg_color=("gray85", "gray20"),
+            fg_color=HEADER_COLORS,
             corner_radius=6,
         )
         self.general_info_label.grid(
@@ -148,7 +311,7 @@ class App(ctk.CTk):
         self.camera_details_label = ctk.CTkLabel(
             self.info_panel,
             text="Camera Details",
-            fg_color=("gray85", "gray20"),
+            fg_color=HEADER_COLORS,
             corner_radius=6,
         )
         self.camera_details_label.grid(
@@ -182,64 +345,67 @@ class App(ctk.CTk):
         self.output_scrollable.grid_columnconfigure(0, weight=1)
 
     def _process_match_counts(self, camera_list):
-        if not camera_list.empty:
-            match_counts = (
-                camera_list.groupby("match_type")["count"].sum().to_dict()
-            )
-        else:
-            match_counts = {}
+        # Four buckets are too few to be worth setting up a groupby
+        match_counts = dict.fromkeys(
+            ("exact", "identified", "potential", "unsupported"), 0
+        )
+        for match_type, count in zip(
+            camera_list["match_type"].to_numpy(),
+            camera_list["count"].to_numpy(),
+        ):
+            if match_type in match_counts:
+                match_counts[match_type] += count
 
         self.current_file_info.update(
             {
-                "exact_matches": match_counts.get("exact", 0),
-                "identified_matches": match_counts.get("identified", 0),
-                "potential_matches": match_counts.get("potential", 0),
-                "unsupported_matches": match_counts.get("unsupported", 0),
+                "exact_matches": match_counts["exact"],
+                "identified_matches": match_counts["identified"],
+                "potential_matches": match_counts["potential"],
+                "unsupported_matches": match_counts["unsupported"],
+                "total_cameras": sum(match_counts.values()),
             }
         )
 
-        self.current_file_info["total_cameras"] = sum(
-            self.current_file_info[k]
-            for k in [
-                "exact_matches",
-                "identified_matches",
-                "potential_matches",
-                "unsupported_matches",
-            ]
+    def _get_recommendations_text(self):
+        # Count the connectors without echoing the table to the terminal
+        recommendations = count_connector_recommendation(
+            self.memory.get_recommendations()
         )
+        if recommendations:
+            return _format_recommendations(recommendations, self.memory)
+        return ""
 
-    def _get_info_text_with_recommendations(self):
-        info_text = self._get_basic_info_text()
+    def _finish_recommendations(self, future, cache_key):
+        """
+        Add background recommendations to the general information.
 
-        if self.recommend_cc_value != 0:
-            memory = MemoryStorage()
-            recommend_connectors(
-                True,
-                self.recommend_cc_value,
-                self.current_camera_list,
-                self.verkada_compatibility_list,
-                memory,
+        Args:
+            future: Future of the running recommendation
+            cache_key: Run key and retention the recommendation was for
+        """
+        if not future.done():
+            self.after(
+                MATCH_POLL_MS, self._finish_recommendations, future, cache_key
             )
-            recommendations = memory.print_recommendations()
-            if recommendations:
-                print("HERE!")
-                info_text.extend(
-                    _format_recommendations(recommendations, memory)
-                )
-
-        return info_text
+            return
+
+        del self._recommendation_futures[cache_key]
+        memory = future.result()
+        memory.set_cache_key(cache_key)
+        # Keep recommendations for a file or retention no longer shown
+        # for when it is shown again, only skipping the redraw
+        run_key, retention = cache_key
+        self._recommendation_cache[(run_key[0], retention)] = memory
+        if cache_key != (self._last_run_key, self.recommend_cc_value):
+            return
+
+        self.memory = memory
+        self._show_general_info(
+            self._get_basic_info_text() + self._get_recommendations_text()
+        )
 
     def _get_basic_info_text(self):
-        return [
-            f"File: {self.current_file_info['filename']} "
-            f"({self.current_file_info['filesize']:.2f} KB)",
-            f"Total Cameras: " f"{self.current_file_info['total_cameras']}",
-            "Camera Breakdown:",
-            f"  - Exact Matches: {self.current_file_info['exact_matches']}",
-            f"  - Identified Matches: {self.current_file_info['identified_matches']}",
-            f"  - Potential Matches: {self.current_file_info['potential_matches']}",
-            f"  - Unsupported Matches: {self.current_file_info['unsupported_matches']}",
-        ]
+        return self.GENERAL_INFO_FORMAT.format_map(self.current_file_info)
 
     def _init_sidebar(self):
         self.sidebar_frame = ctk.CTkFrame(self, width=300, corner_radius=0)
@@ -324,6 +490,11 @@ class App(ctk.CTk):
         self.force_column_entry.grid(
             row=3, column=0, sticky="new", pady=(0, 15)
         )
+        # Parse the column once per edit instead of on every check
+        for sequence in ("<KeyRelease>", "<FocusOut>"):
+            self.force_column_entry.bind(
+                sequence, self._on_force_column_change
+            )
 
     def _create_main_window(self):
         # Main frame
@@ -341,7 +512,7 @@ class App(ctk.CTk):
             self.top_frame,
             text="No File Selected",
             font=ctk.CTkFont(size=13),
-            fg_color=("gray85", "gray20"),
+            fg_color=HEADER_COLORS,
             corner_radius=6,
         )
         self.page_label.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
@@ -356,56 +527,233 @@ class App(ctk.CTk):
 
     def update_general_info(self, file_path, camera_list):
         """Update the general information display."""
-        # Clear previous information
-        for widget in self.general_info_frame.winfo_children():
-            widget.destroy()
-
         # Update file information
         self.current_file_info = {
-            "filename": os.path.basename(file_path),
-            "filesize": os.path.getsize(file_path) / 1024,
+            "filename": self.file_names[file_path],
+            "filesize": self.file_sizes[file_path] / 1024,
         }
 
         # Process match counts
         self._process_match_counts(camera_list)
 
-        # Get info text with recommendations
-        info_text = self._get_info_text_with_recommendations()
+        info_text = self._get_basic_info_text()
+        if self.recommend_cc_value != 0:
+            # Only recalculate when an input to the recommendation changed
+            cache_key = (self._last_run_key, self.recommend_cc_value)
+            # Switching back to a file or retention shown before reuses
+            # the recommendations worked out for it then
+            cached_memory = self._recommendation_cache.get(
+                (file_path, self.recommend_cc_value)
+            )
+            if cached_memory is not None and cached_memory.matches_cache_key(
+                cache_key
+            ):
+                self.memory = cached_memory
+                info_text += self._get_recommendations_text()
+            elif cache_key not in self._recommendation_futures:
+                # Show the counts now and add recommendations once ready,
+                # unless the same recommendation is already being worked out
+                future = self._executor.submit(
+                    _recommend_for_cameras,
+                    self.recommend_cc_value,
+                    self.current_camera_list,
+                    self.verkada_compatibility_list,
+                )
+                self._recommendation_futures[cache_key] = future
+                self.after(
+                    MATCH_POLL_MS,
+                    self._finish_recommendations,
+                    future,
+                    cache_key,
+                )
+        self._show_general_info(info_text)
+
+    def _show_general_info(self, info_text):
+        """
+        Display the general information text.
 
-        # Create label with updated info
-        ctk.CTkLabel(
-            self.general_info_frame,
-            text="\n".join(info_text),
-            anchor="w",
-            justify="left",
-            wraplength=400,
-        ).pack(fill="both", padx=5, pady=5)
+        Args:
+            info_text: Text to show in the general information panel
+        """
+        # Nothing to redraw when the same information is already displayed
+        if info_text == self._general_info_text:
+            return
+        self._general_info_text = info_text
+
+        # Reuse the label once it exists rather than rebuilding it
+        if self.general_info_content is None:
+            self.general_info_content = _create_info_label(
+                self.general_info_frame
+            )
+            self.general_info_content.pack(fill="both", padx=5, pady=5)
+        self.general_info_content.configure(text=info_text)
 
     def select_files_event(self):
         """
         Shows files selected by the user and sets them as a button.
         :return:
         """
-        if files := filedialog.askopenfilenames(
-            title="Choose files to Run", filetypes=[("CSV files", "*.csv")]
+        # Some Tk builds hand back one brace-quoted string instead of a
+        # tuple, so let Tk's own tokenizer split it in a single pass
+        if files := self.tk.splitlist(
+            filedialog.askopenfilenames(
+                title="Choose files to Run",
+                filetypes=[("CSV files", "*.csv")],
+            )
         ):
+            # Keep the existing buttons when the selection did not change
+            if list(files) == self.file_paths:
+                return
+
+            # Results for the previous selection have nowhere to go
+            self._cancel_match()
+
             # Clean Previous Files
             self.file_paths.clear()
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
+            self.file_names.clear()
+            # Hide the buttons this selection does not need instead of
+            # destroying them one by one, keeping them for reuse
+            for button in self._file_buttons[len(files) :]:
+                button.grid_remove()
 
             # Add Files
             for count, file in enumerate(files):
                 self.file_paths.append(file)
-                filename = os.path.basename(file)
-                ctk.CTkButton(
-                    self.scrollable_frame,
-                    text=filename,
+                self.file_names[file] = os.path.basename(file)
+                if count < len(self._file_buttons):
+                    button = self._file_buttons[count]
+                else:
+                    button = ctk.CTkButton(self.scrollable_frame)
+                    self._file_buttons.append(button)
+                button.configure(
+                    text=self.file_names[file],
                     command=lambda f=file: self.run_compatibility_check(f),
-                ).grid(row=count, column=0, sticky="ew", pady=2)
-                self.scrollable_frame.configure(
-                    label_text=f"Selected Files ({len(self.file_paths)}):"
                 )
+                button.grid(row=count, column=0, sticky="ew", pady=2)
+            self.scrollable_frame.configure(
+                label_text=f"Selected Files ({len(self.file_paths)}):"
+            )
+            self._prematch_files()
+
+    def _prematch_files(self):
+        """
+        Match every selected file in parallel ahead of it being clicked,
+        so a later check of an unchanged file is shown straight away.
+        """
+        # Drop matches queued for an earlier selection that have not run
+        for _, future in self._prematch_futures.values():
+            future.cancel()
+        self._prematch_futures.clear()
+
+        if self._compatibility_future is not None:
+            # Wait for the compatibility list the files are matched against
+            self.after(MATCH_POLL_MS, self._prematch_files)
+            return
+        if self.verkada_compatibility_list is None:
+            return
+
+        for file_path in self.file_paths:
+            run_key = self._get_run_key(file_path)
+            if self._match_cache.get(file_path, (None,))[0] == run_key:
+                continue
+            self._prematch_futures[file_path] = (
+                run_key,
+                self._submit_prematch(file_path),
+            )
+        if self._prematch_futures:
+            self.after(MATCH_POLL_MS, self._collect_prematches)
+
+    def _submit_prematch(self, file_path):
+        """
+        Queue a file to be matched in advance on the process pool.
+
+        Args:
+            file_path: Path to the customer CSV file
+
+        Returns:
+            Future of the match
+        """
+        args = (
+            _match_customer_file,
+            file_path,
+            self.verkada_compatibility_list,
+            self.force_column_value,
+            self.verkada_manufacturers,
+        )
+        try:
+            return self._get_match_pool().submit(*args)
+        except BrokenProcessPool as error:
+            # A worker died, so carry on with a fresh pool
+            log.warning("Restarting the match pool: %s", error)
+            self._shutdown_match_pool()
+            return self._get_match_pool().submit(*args)
+
+    def _get_match_pool(self):
+        """
+        Get the process pool, with a worker per selected file up to the
+        number of CPUs.
+
+        Returns:
+            ProcessPoolExecutor for matching files in advance
+        """
+        workers = min(len(self.file_paths), os.cpu_count() or 1)
+        # Only replace the pool when a larger selection could use more
+        if self._match_pool is None or self._match_pool_size < workers:
+            self._shutdown_match_pool()
+            # Spawn workers, as forking beside Tk and a thread can hang
+            self._match_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            self._match_pool_size = workers
+        return self._match_pool
+
+    def _shutdown_match_pool(self):
+        """Stop the process pool, dropping the files still queued on it."""
+        if self._match_pool is not None:
+            self._match_pool.shutdown(wait=False, cancel_futures=True)
+            self._match_pool = None
+            self._match_pool_size = 0
+
+    def _collect_prematches(self):
+        """Move finished background matches into the match cache."""
+        for file_path, (run_key, future) in list(
+            self._prematch_futures.items()
+        ):
+            if not future.done():
+                continue
+            del self._prematch_futures[file_path]
+            # Failed matches are left for a click to rerun and report
+            if future.cancelled() or future.exception() is not None:
+                continue
+            matched_cameras = future.result()
+            if (
+                matched_cameras is not None
+                and self._match_cache.get(file_path, (None,))[0] != run_key
+            ):
+                self._match_cache[file_path] = (run_key, matched_cameras)
+        if self._prematch_futures:
+            self.after(MATCH_POLL_MS, self._collect_prematches)
+
+    def _get_run_key(self, file_path):
+        """
+        Describe the inputs a compatibility check of a file depends on.
+
+        Args:
+            file_path: Path to the customer CSV file
+
+        Returns:
+            Tuple of the path, its mtime, forced column and list version
+        """
+        # Stat the file once for both its size and modification time
+        file_stat = os.stat(file_path)
+        self.file_sizes[file_path] = file_stat.st_size
+        return (
+            file_path,
+            file_stat.st_mtime,
+            self.force_column_value,
+            self._compatibility_mtime,
+        )
 
     def run_compatibility_check(self, file_path):
         """
@@ -413,53 +761,197 @@ class App(ctk.CTk):
         :param file_path:
         :return:
         """
-        self.page_label.configure(text=f"{os.path.basename(file_path)}")
-
-        if (
-            self.force_column_entry.get() is None
-            or self.force_column_entry.get().strip() == ""
-        ):
-            self.force_column_value = None
-        else:
-            self.force_column_value = int(self.force_column_entry.get())
+        # A retry can outlive the selection its file belonged to
+        self._match_retry = None
+        if file_path not in self.file_names:
+            return
+        self.page_label.configure(text=self.file_names[file_path])
 
         if file_path:
-            matched_cameras = get_camera_match(
-                parse_customer_list(file_path),
+            # Pick up edits made to the compatibility list since loading it
+            if (
+                self._compatibility_future is None
+                and os.path.getmtime(self.command_connector_compatibility_list)
+                != self._compatibility_mtime
+            ):
+                self._load_compatibility_list()
+
+            if self._compatibility_future is not None:
+                # Check the file once the compatibility list has loaded,
+                # dropping any match started against the previous list
+                self._cancel_match()
+                self._match_retry = self.after(
+                    MATCH_POLL_MS, self.run_compatibility_check, file_path
+                )
+                return
+            if self.verkada_compatibility_list is None:
+                log.error("No compatibility list to check against.")
+                return
+
+            run_key = self._get_run_key(file_path)
+            if (
+                run_key == self._pending_run_key
+                and self._match_future is not None
+            ):
+                # This file is already being matched with the same inputs
+                return
+            self._cancel_match()
+            self._pending_run_key = run_key
+            if run_key == self._last_run_key:
+                # The table already shows this file, only refresh the info
+                self.update_general_info(file_path, self.current_camera_list)
+                return
+
+            # Reuse the match from the last time this file was checked
+            cached_key, cached_cameras = self._match_cache.get(
+                file_path, (None, None)
+            )
+            if cached_key == run_key:
+                self._show_matched_cameras(run_key, cached_cameras)
+                return
+
+            # Wait on a match started in advance that is already running,
+            # but take one still queued behind other files out of the pool
+            # rather than wait for its turn
+            prematch_key, prematch_future = self._prematch_futures.get(
+                file_path, (None, None)
+            )
+            if prematch_key != run_key or prematch_future.cancel():
+                prematch_future = None
+            self._start_match(run_key, prematch_future)
+
+    def _start_match(self, run_key, future=None):
+        """
+        Wait on a background match of a file, starting one if needed.
+
+        Args:
+            run_key: Inputs the file is matched with
+            future: Future of a match of the file already running, if any
+        """
+        if future is None:
+            # Match in the background so the window stays responsive
+            future = self._executor.submit(
+                _match_customer_file,
+                run_key[0],
                 self.verkada_compatibility_list,
                 self.force_column_value,
+                self.verkada_manufacturers,
             )
-            if matched_cameras is not None:
-                self.current_camera_list = (
-                    matched_cameras  # Store for reference
-                )
-                self.populate_table(matched_cameras)
-                self.update_general_info(file_path, matched_cameras)
-                print(matched_cameras)
+        self._match_future = future
+        self.after(
+            MATCH_POLL_MS, self._finish_compatibility_check, future, run_key
+        )
+
+    def _cancel_match(self):
+        """Stop waiting on a check that a newer one has superseded."""
+        self._pending_run_key = None
+        if self._match_retry is not None:
+            self.after_cancel(self._match_retry)
+            self._match_retry = None
+        # A match still queued behind another is dropped before it runs,
+        # but one started in advance is left for when its file is clicked
+        if self._match_future is not None and all(
+            future is not self._match_future
+            for _, future in self._prematch_futures.values()
+        ):
+            self._match_future.cancel()
+        self._match_future = None
+
+    def _finish_compatibility_check(self, future, run_key):
+        """
+        Display a background match once it completes.
+
+        Args:
+            future: Future of the running match
+            run_key: Inputs the match was started with
+        """
+        if not future.done():
+            self.after(
+                MATCH_POLL_MS,
+                self._finish_compatibility_check,
+                future,
+                run_key,
+            )
+            return
+
+        # Drop results that a newer check has already superseded
+        if future is not self._match_future:
+            return
+        self._match_future = None
+
+        try:
+            matched_cameras = future.result()
+        except BrokenProcessPool as error:
+            # The match started in advance was lost, so run it here
+            log.warning("Matching %s again: %s", run_key[0], error)
+            self._start_match(run_key)
+            return
+        if matched_cameras is not None:
+            self._match_cache[run_key[0]] = (run_key, matched_cameras)
+            self._show_matched_cameras(run_key, matched_cameras)
+
+    def _show_matched_cameras(self, run_key, matched_cameras):
+        """
+        Display the matched cameras for a customer file.
+
+        Args:
+            run_key: Inputs the cameras were matched with
+            matched_cameras: DataFrame of matched cameras
+        """
+        file_path = run_key[0]
+        self.current_camera_list = matched_cameras  # Store for reference
+        self._export_text = None
+        # Index the rows by name so clicking a camera is a single lookup,
+        # keeping only the columns the details show as plain tuples
+        self.current_cameras_by_name = {
+            name: (count, match_type, verkada_model)
+            for name, count, match_type, verkada_model in matched_cameras[
+                ["name", "count", "match_type", "verkada_model"]
+            ].itertuples(index=False, name=None)
+        }
+        self.current_file_path = file_path
+        self._last_run_key = run_key
+        self.populate_table(matched_cameras)
+        self.update_general_info(file_path, matched_cameras)
+        log.debug("Matched cameras:\n%s", matched_cameras)
 
     def add_row_to_scrollable_frame(
-        self, frame, camera_name, verkada_camera, colors
+        self, camera_name, verkada_camera, colors, row
     ):
         """Add a new row to the scrollable frame with camera information.
+
+        Row widgets left over from a previously shown list are
+        reconfigured in place, and new ones are only created once the
+        list grows past them.
+
         Args:
-            frame: The parent frame to add the row to
             camera_name: Name of the camera
             verkada_camera: Corresponding Verkada camera model
             colors: Tuple of colors for the row background
+            row: Grid row to place the camera in
         """
-        row_frame = ctk.CTkFrame(frame, fg_color=colors, corner_radius=6)
-        row_frame.grid_columnconfigure(0, weight=1)
-        camera_button = ctk.CTkButton(
-            row_frame,
+        if row < len(self._camera_rows):
+            row_frame, camera_button = self._camera_rows[row]
+            row_frame.configure(fg_color=colors)
+        else:
+            row_frame = ctk.CTkFrame(
+                self.output_scrollable, fg_color=colors, corner_radius=6
+            )
+            row_frame.grid_columnconfigure(0, weight=1)
+            camera_button = ctk.CTkButton(
+                row_frame, anchor="w", text_color=ROW_TEXT_COLORS
+            )
+            camera_button.grid(row=0, column=0, sticky="ew")
+            self._camera_rows.append((row_frame, camera_button))
+
+        camera_button.configure(
             text=f"{camera_name} ({verkada_camera})",
-            anchor="w",
             command=lambda f=camera_name: self.show_camera_details(f),
             fg_color=colors,
             hover_color=colors[::-1],
-            text_color=("#000000", "#ffffff"),
         )
-        camera_button.grid(row=0, column=0, sticky="ew")
-        row_frame.pack(fill="x", padx=5, pady=2)
+        # Give each row its own grid cell rather than repacking the list
+        row_frame.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
 
     def show_camera_details(self, camera_name):
         """
@@ -467,46 +959,43 @@ class App(ctk.CTk):
         :param camera_name:
         :return:
         """
-        # Clear previous camera details
-        for widget in self.camera_details_frame.winfo_children():
-            widget.destroy()
-
         # Find camera in the current data
-        camera_data = None
-        for _, row in self.current_camera_list.iterrows():
-            if row["name"] == camera_name:
-                camera_data = row
-                break
+        camera_data = self.current_cameras_by_name.get(camera_name)
 
+        details_text = None
         if camera_data is not None:
+            count, match_type, verkada_model = camera_data
             # Get Verkada details
-            verkada_details = list_verkada_camera_details(
-                camera_data["verkada_model"], self.verkada_compatibility_list
-            )
+            verkada_camera = self.verkada_models.get(verkada_model)
 
             # Display camera information
-            details = [
-                f"Name: {camera_name}",
-                f"Count: {int(camera_data['count'])}",
-                f"Match Type: {camera_data['match_type']}",
-            ]
-            if camera_data["match_type"] != "unsupported":
-                details = details + [
-                    "Verkada Verified Details:",
-                    f"  - Name: {camera_data['verkada_model']}",
-                    f"  - Manufacturer: {verkada_details[1]}",
-                    f"  - Min. Firmware: {verkada_details[2]}",
-                    f"  - Notes: {verkada_details[3]}",
-                ]
-            (
-                ctk.CTkLabel(
-                    self.camera_details_frame,
-                    text="\n".join(details),
-                    anchor="w",
-                    justify="left",
-                    wraplength=400,
-                ).pack(fill="both", padx=5, pady=5)
+            details_text = self.CAMERA_DETAILS_FORMAT.format(
+                camera_name, count, match_type
             )
+            if match_type != "unsupported" and verkada_camera is not None:
+                details_text += self.VERKADA_DETAILS_FORMAT.format(
+                    verkada_model,
+                    verkada_camera.manufacturer,
+                    verkada_camera.minimum_supported_firmware_version,
+                    verkada_camera.notes,
+                )
+
+        # Nothing to redraw when the same details are already displayed
+        if details_text == self._camera_details_text:
+            return
+        self._camera_details_text = details_text
+
+        # Hide the label when there is nothing to show, keeping it for reuse
+        if details_text is None:
+            if self.camera_details_content is not None:
+                self.camera_details_content.pack_forget()
+            return
+        if self.camera_details_content is None:
+            self.camera_details_content = _create_info_label(
+                self.camera_details_frame
+            )
+        self.camera_details_content.configure(text=details_text)
+        self.camera_details_content.pack(fill="both", padx=5, pady=5)
 
     def populate_table(self, camera_list: pd.DataFrame):
         """
@@ -515,17 +1004,61 @@ class App(ctk.CTk):
         Args:
             camera_list: DataFrame containing camera information
         """
-        for widget in self.output_scrollable.winfo_children():
-            widget.destroy()
+        # Stop filling in the rows of a previously shown list
+        if self._populate_job is not None:
+            self.after_cancel(self._populate_job)
+            self._populate_job = None
+
+        # Unmap the list while rows are swapped so it is laid out and
+        # redrawn once for the whole batch instead of after every row
+        self.output_scrollable.grid_remove()
+        try:
+            # Hide every row the first batch does not refill, keeping them
+            # for reuse, so rows of the previous list cannot be clicked
+            # before a later batch brings them up to date
+            first_batch = min(len(camera_list), ROW_BATCH_SIZE)
+            for row_frame, _ in self._camera_rows[first_batch:]:
+                row_frame.grid_remove()
+
+            # Rows only show these three values, so pull them out of the
+            # frame once rather than slicing it again for every batch
+            rows = list(
+                zip(
+                    camera_list["name"].to_numpy(),
+                    camera_list["verkada_model"].to_numpy(),
+                    camera_list["match_type"]
+                    .map(MATCH_TYPE_COLORS)
+                    .to_numpy(),
+                )
+            )
+            self._add_camera_rows(rows, 0)
+        finally:
+            self.output_scrollable.grid()
+
+    def _add_camera_rows(self, rows: list, start: int):
+        """
+        Add one batch of camera rows, scheduling the next batch if any.
+
+        Long lists are built a batch at a time so the first rows show
+        up straight away and the window keeps handling events.
+
+        Args:
+            rows: Camera name, Verkada model and row colors for each row
+            start: Position of the first row in this batch
+        """
+        end = start + ROW_BATCH_SIZE
+
+        for row, (name, verkada_model, colors) in enumerate(
+            rows[start:end], start
+        ):
+            self.add_row_to_scrollable_frame(name, verkada_model, colors, row)
 
-        for _, row in camera_list.iterrows():
-            color = _get_color_for_match_type(row["match_type"])
-            self.add_row_to_scrollable_frame(
-                self.output_scrollable,
-                row["name"],
-                row["verkada_model"],
-                color,
+        if end < len(rows):
+            self._populate_job = self.after(
+                1, self._add_camera_rows, rows, end
             )
+        else:
+            self._populate_job = None
 
     def set_recommend_cc_retention(self, value):
         """
@@ -536,6 +1069,15 @@ class App(ctk.CTk):
         """
         self.recommend_cc_value = 0 if value == "None" else int(value)
 
+    def _on_force_column_change(self, *_):
+        """Parse the forced model column whenever its entry is edited."""
+        value = self.force_column_entry.get().strip()
+        try:
+            self.force_column_value = int(value) if value else None
+        except ValueError:
+            log.warning("Ignoring non-numeric force column '%s'", value)
+            self.force_column_value = None
+
     def set_force_column(self, value):
         """
         Set the force column value for data processing.
@@ -550,11 +1092,12 @@ class App(ctk.CTk):
         Export the current camera list to a CSV file.
         Prompts user for save location and exports data.
         """
-        cameras_dataframe = self.current_camera_list
         files = [("CSV files", "*.csv"), ("All Files", "*.*")]
         filepath = filedialog.asksaveasfilename(filetypes=files)
-        if filepath:
-            export_to_csv(cameras_dataframe, filepath)
+        # Serialize each camera list once, however often it is exported
+        self._export_text = export_to_csv(
+            self.current_camera_list, filepath, self._export_text
+        )
 
 
 def change_appearance_mode_event(mode):
@@ -6,13 +6,17 @@ Purpose: Import a list of third-party cameras and return to the terminal
     which cameras are compatible with the cloud connector.
 """
 
-from app.calculations import (
-    get_camera_match,
-    compile_camera_mp_channels,
-)
+import argparse
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from app.calculations import get_camera_match
 from app.file_handling import (
-    parse_hardware_compatibility_list,
+    load_compatibility_list,
     parse_customer_list,
+    read_cache,
+    write_cache,
 )
 from app.output import print_results
 from app.recommend import recommend_connectors
@@ -20,6 +24,65 @@ from app.memory_management import MemoryStorage
 from app import log
 
 RETENTION = 30  # Required storage in days
+COMPATIBILITY_LIST = "Verkada Command Connector Compatibility.csv"
+MATCH_CACHE_ENV = "CCC_MATCH_CACHE"  # Set to 1 to reuse previous matches
+MATCH_CACHE_DIR = ".cache"
+# Bump when get_camera_match changes its results so stale matches rerun
+MATCH_CACHE_VERSION = 1
+
+
+def _match_cache(
+    customer_model_filepath,
+    customer_cameras_raw,
+    verkada_compatibility_list,
+    camera_column,
+):
+    """
+    Run get_camera_match, reusing the result of an earlier run when
+    neither the customer list nor the compatibility list has changed.
+
+    Matches are pickled under MATCH_CACHE_DIR, one file per customer
+    list, keyed by MATCH_CACHE_VERSION, the forced model column and the
+    path, modification time and size of both CSV files. The cache is
+    only used when the CCC_MATCH_CACHE environment variable is set to 1.
+
+    Args:
+        customer_model_filepath (str): The path of the customer list.
+        customer_cameras_raw (pd.DataFrame): The parsed customer list.
+        verkada_compatibility_list (List[CompatibleModel]): The
+            compatible models to match against.
+        camera_column (int, optional): A column name identifying the
+            camera model.
+
+    Returns:
+        pd.DataFrame: The matched cameras, or None if no model column
+            could be identified.
+    """
+    if os.environ.get(MATCH_CACHE_ENV) != "1":
+        return get_camera_match(
+            customer_cameras_raw, verkada_compatibility_list, camera_column
+        )
+
+    paths = tuple(
+        os.path.abspath(path)
+        for path in (customer_model_filepath, COMPATIBILITY_LIST)
+    )
+    source_key = (MATCH_CACHE_VERSION, camera_column) + tuple(
+        (path, stat.st_mtime_ns, stat.st_size)
+        for path, stat in zip(paths, map(os.stat, paths))
+    )
+    # Name the file after the lists alone, so each rerun after an edit
+    # replaces the stale entry instead of leaving it behind
+    digest = hashlib.sha1(repr(paths).encode()).hexdigest()
+    cache_file = os.path.join(MATCH_CACHE_DIR, f"matched_{digest}.pkl")
+
+    matched_cameras = read_cache(cache_file, source_key)
+    if matched_cameras is None:
+        matched_cameras = get_camera_match(
+            customer_cameras_raw, verkada_compatibility_list, camera_column
+        )
+        write_cache(cache_file, source_key, matched_cameras)
+    return matched_cameras
 
 
 def main(customer_model_filepath, camera_column):
@@ -43,21 +106,25 @@ def main(customer_model_filepath, camera_column):
         None
     """
 
-    command_connector_compatibility_list = (
-        "Verkada Command Connector Compatibility.csv"
-    )
-
-    verkada_compatibility_list = compile_camera_mp_channels(
-        parse_hardware_compatibility_list(command_connector_compatibility_list)
-    )
+    # The two files are independent, so read them at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        verkada_future = executor.submit(
+            load_compatibility_list, COMPATIBILITY_LIST
+        )
+        customer_future = executor.submit(
+            parse_customer_list, customer_model_filepath
+        )
+        verkada_compatibility_list = verkada_future.result()
+        customer_cameras_raw = customer_future.result()
     # NOTE: Uncomment to print raw csv
     # tabulate_data(
     #     [customer_cameras_raw.columns.tolist()]
     #     + customer_cameras_raw.T.values.tolist()
     # )
 
-    matched_cameras = get_camera_match(
-        parse_customer_list(customer_model_filepath),
+    matched_cameras = _match_cache(
+        customer_model_filepath,
+        customer_cameras_raw,
         verkada_compatibility_list,
         camera_column,
     )
@@ -82,8 +149,27 @@ def main(customer_model_filepath, camera_column):
 
 # Execute if being run directly
 if __name__ == "__main__":
-    # Modify the file path
     CSV_FILEPATH = "Camera Compatibility Sheets/customer_sheet_8.csv"
-    # [Optional] Modify the column number to force a specific model column number
     MODEL_COLUMN = None
-    main(CSV_FILEPATH, MODEL_COLUMN)
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check which cameras in a customer list are compatible with "
+            "the Command Connector."
+        )
+    )
+    parser.add_argument(
+        "filepath",
+        nargs="?",
+        default=CSV_FILEPATH,
+        help="CSV file of customer cameras (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        type=int,
+        default=MODEL_COLUMN,
+        help="force a specific model column number",
+    )
+    args = parser.parse_args()
+    main(args.filepath, args.column)
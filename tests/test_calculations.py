@@ -0,0 +1,204 @@
+"""
+Author: Ian Young
+Purpose: Test the camera matching and counting calculations using pytest.
+"""
+
+import pandas as pd
+from thefuzz import process
+
+from app import CompatibleModel, calculations
+from app.calculations import (
+    compile_camera_mp_channels,
+    count_mp,
+    get_camera_count,
+    get_camera_match,
+)
+
+
+def make_results(names, match_types=None):
+    """Build match results for the given camera names."""
+    return pd.DataFrame(
+        {
+            "name": names,
+            "match_type": match_types or ["exact"] * len(names),
+            "verkada_model": names,
+        }
+    )
+
+
+def test_get_camera_count_from_repeated_names():
+    """Without a count column, each camera counts once per row."""
+    # Arrange
+    customer_list = pd.DataFrame({"Model": ["a", "b", "a", "a", ""]})
+    results = make_results(
+        ["a", "b", "a", "a", None], ["exact"] * 4 + ["empty"]
+    )
+
+    # Act
+    counts = get_camera_count(customer_list, results)
+
+    # Assert
+    assert counts[["name", "count"]].values.tolist() == [["a", 3], ["b", 1]]
+
+
+def test_get_camera_count_from_count_column():
+    """A count column is summed per camera, counting unreadable counts
+    as one camera."""
+    # Arrange
+    customer_list = pd.DataFrame(
+        {"Model": ["a", "b", "a", "c"], "Count": ["2", "5", "4", "n/a"]}
+    )
+    results = make_results(["a", "b", "a", "c"])
+
+    # Act
+    counts = get_camera_count(customer_list, results)
+
+    # Assert
+    assert counts[["name", "count"]].values.tolist() == [
+        ["a", 6],
+        ["b", 5],
+        ["c", 1],
+    ]
+
+
+def test_get_camera_count_stores_whole_counts_as_integers():
+    """Whole counts are stored as integers, even from a float column."""
+    # Arrange
+    customer_list = pd.DataFrame(
+        {"Model": ["a", "b"], "Count": [2.0, float("nan")]}
+    )
+    results = make_results(["a", "b"])
+
+    # Act
+    counts = get_camera_count(customer_list, results)
+
+    # Assert
+    assert counts["count"].dtype == "int64"
+    assert counts["count"].tolist() == [2, 1]
+
+
+def test_get_camera_count_keeps_fractional_counts():
+    """Fractional counts are kept as given instead of truncated."""
+    # Arrange
+    customer_list = pd.DataFrame(
+        {"Model": ["a", "b", "a"], "Count": ["1.5", "2", "1"]}
+    )
+    results = make_results(["a", "b", "a"])
+
+    # Act
+    counts = get_camera_count(customer_list, results)
+
+    # Assert
+    assert counts["count"].tolist() == [2.5, 2.0]
+
+
+def test_get_camera_match_scores_each_model_once(monkeypatch):
+    """Repeated models are scored once and share their match."""
+    # Arrange
+    customer_list = pd.DataFrame(
+        {"Model": ["M3007", "P3367", "M3007", "", "XYZ-1", "M3007"]}
+    )
+    verkada_cameras = [
+        CompatibleModel("m3007", "Axis Communications", "6.50.5.4", ""),
+        CompatibleModel("p3367", "Axis Communications", "6.50.5.5", ""),
+    ]
+    scored = []
+    extract_one = process.extractOne
+
+    def count_scores(camera, *args, **kwargs):
+        scored.append(camera)
+        return extract_one(camera, *args, **kwargs)
+
+    # Matching is tested on its own, without sanitizing the list first
+    monkeypatch.setattr(
+        calculations, "sanitize_customer_data", lambda df, _: df
+    )
+    monkeypatch.setattr(process, "extractOne", count_scores)
+
+    # Act
+    matches = get_camera_match(customer_list, verkada_cameras, 0)
+
+    # Assert
+    assert sorted(set(scored)) == ["M3007", "P3367", "XYZ-1"]
+    assert len(scored) == 3 * 3  # Three scorers per distinct model
+    assert matches[
+        ["name", "match_type", "verkada_model", "count"]
+    ].values.tolist() == [
+        ["M3007", "exact", "m3007", 3],
+        ["P3367", "exact", "p3367", 1],
+        ["XYZ-1", "unsupported", None, 1],
+    ]
+
+
+def test_count_mp_totals_cameras_per_model():
+    """Cameras are totalled per model into low and high megapixel
+    channels, leaving out unmatched cameras."""
+    # Arrange
+    verkada_cameras = [
+        CompatibleModel("m3007", "Axis Communications", "", "", mp=5),
+        CompatibleModel("p3367", "Axis Communications", "", "", mp=8),
+    ]
+    cameras = pd.DataFrame(
+        {
+            "verkada_model": ["m3007", "p3367", None, "m3007"],
+            "count": [2, 3, 7, 4],
+        }
+    )
+
+    # Act
+    result = count_mp(cameras, verkada_cameras)
+
+    # Assert
+    assert result == [6, 3]
+
+
+def test_count_mp_looks_up_models_by_name():
+    """Models are found whatever their case, using the first model
+    listed under a name."""
+    # Arrange
+    verkada_cameras = [
+        CompatibleModel("m3007", "Axis Communications", "", "", mp=2),
+        CompatibleModel("m3007", "Hanwha", "", "", mp=12),
+    ]
+    cameras = pd.DataFrame(
+        {"verkada_model": ["M3007", "unknown"], "count": [5, 9]}
+    )
+
+    # Act
+    result = count_mp(cameras, verkada_cameras)
+
+    # Assert
+    assert result == [5, 0]
+
+
+def test_compile_camera_mp_channels(tmp_path):
+    """Every model sharing a spec's name, whatever its case, gets the
+    spec's megapixels and channels, added up over repeated specs."""
+    # Arrange
+    camera_specs = tmp_path / "specs.csv"
+    camera_specs.write_text(
+        "Manufacturer,Model Name,MP,Channels\n"
+        "Axis,M3007,5,4\n"
+        "Axis,P3367,5,1\n"
+        "Axis,p3367,3,1\n"
+        "Axis,Unlisted,8,1\n",
+        encoding="UTF-8",
+    )
+    verkada_cameras = [
+        CompatibleModel("m3007", "Axis Communications", "", ""),
+        CompatibleModel("p3367", "Axis Communications", "", ""),
+        CompatibleModel("m3007", "Hanwha", "", ""),
+        CompatibleModel("q6135", "Axis Communications", "", ""),
+    ]
+
+    # Act
+    compiled = compile_camera_mp_channels(verkada_cameras, str(camera_specs))
+
+    # Assert
+    assert compiled is verkada_cameras
+    assert [(model.mp, model.channels) for model in compiled] == [
+        (5, 4),
+        (8, 2),
+        (5, 4),
+        (0, 0),
+    ]
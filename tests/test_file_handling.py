@@ -0,0 +1,204 @@
+"""
+Author: Ian Young
+Purpose: Test the pickled caches of compiled data using pytest.
+"""
+
+import os
+import pickle
+import sys
+import types
+
+import pytest
+
+from app import file_handling
+from app import CompatibleModel
+from app.file_handling import (
+    load_compatibility_list,
+    parse_hardware_compatibility_list,
+    read_cache,
+    write_cache,
+)
+
+COMPATIBILITY_CSV = (
+    "Verkada Command Connector Hardware Compatibility List\n"
+    "\n"
+    "\n"
+    "\n"
+    "Manufacturer,Model Name,Minimum Firmware Supported,Notes\n"
+    "Axis Communications,M3007,6.50.5.4,\n"
+    "Axis Communications,P3367,6.50.5.5,Needs a license\n"
+)
+
+
+@pytest.fixture(name="sources")
+def fixture_sources(tmp_path, monkeypatch):
+    """
+    Write a small compatibility list and camera specs file, and count
+    how many times the list is compiled from them.
+
+    Returns:
+        Tuple[str, str, List[int]]: The compatibility list path, the
+            camera specs path and a list holding the compile count.
+    """
+    compatibility_list = tmp_path / "compatibility.csv"
+    compatibility_list.write_text(COMPATIBILITY_CSV, encoding="UTF-8")
+    camera_specs = tmp_path / "specs.csv"
+    camera_specs.write_text("Model,MP\n", encoding="UTF-8")
+
+    compiles = [0]
+
+    def compile_models(models, camera_specs_file):
+        # The list must be compiled from the specs file it is keyed on
+        assert camera_specs_file == str(camera_specs)
+        compiles[0] += 1
+        return models
+
+    monkeypatch.setattr(file_handling, "CAMERA_SPECS_FILE", str(camera_specs))
+    monkeypatch.setattr(
+        file_handling, "compile_camera_mp_channels", compile_models
+    )
+    return str(compatibility_list), str(camera_specs), compiles
+
+
+def test_write_then_read_cache(tmp_path):
+    """A value written under a key is read back under the same key."""
+    cache_file = str(tmp_path / "nested" / "value.pkl")
+
+    write_cache(cache_file, ("key", 1), {"cameras": [1, 2]})
+
+    assert read_cache(cache_file, ("key", 1)) == {"cameras": [1, 2]}
+    assert read_cache(cache_file, ("key", 2)) is None
+
+
+def test_read_missing_cache(tmp_path):
+    """A cache file that does not exist is a miss."""
+    assert read_cache(str(tmp_path / "missing.pkl"), "key") is None
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"", b"not a pickle", pickle.dumps("no key")],
+    ids=["empty_file", "corrupt_file", "wrong_shape"],
+)
+def test_read_unreadable_cache(tmp_path, contents):
+    """A cache file that cannot be unpickled is a miss."""
+    cache_file = tmp_path / "value.pkl"
+    cache_file.write_bytes(contents)
+
+    assert read_cache(str(cache_file), "key") is None
+
+
+def test_read_unresolvable_cache(tmp_path, monkeypatch):
+    """A cache of a class that no longer imports is a miss."""
+    module = types.ModuleType("removed_module")
+    monkeypatch.setitem(sys.modules, "removed_module", module)
+
+    class Removed:  # pylint: disable=too-few-public-methods
+        """Class that is gone by the time the cache is read."""
+
+    Removed.__module__ = "removed_module"
+    Removed.__qualname__ = "Removed"
+    module.Removed = Removed
+    cache_file = str(tmp_path / "value.pkl")
+    write_cache(cache_file, "key", Removed())
+    monkeypatch.delitem(sys.modules, "removed_module")
+
+    assert read_cache(cache_file, "key") is None
+
+
+def test_compatibility_cache_hit(sources):
+    """Unchanged sources load the compiled list from the cache."""
+    compatibility_list, _, compiles = sources
+
+    first = load_compatibility_list(compatibility_list)
+    second = load_compatibility_list(compatibility_list)
+
+    assert compiles[0] == 1
+    assert second == first
+    assert [model.notes for model in second] == ["", "Needs a license"]
+
+
+@pytest.mark.parametrize(
+    "source", [0, 1], ids=["compatibility_list", "camera_specs"]
+)
+def test_compatibility_cache_mtime_change(sources, source):
+    """Touching either source compiles the list again."""
+    compiles = sources[2]
+    load_compatibility_list(sources[0])
+    stat = os.stat(sources[source])
+    os.utime(sources[source], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    load_compatibility_list(sources[0])
+
+    assert compiles[0] == 2
+
+
+@pytest.mark.parametrize(
+    "source", [0, 1], ids=["compatibility_list", "camera_specs"]
+)
+def test_compatibility_cache_size_change(sources, source):
+    """Editing either source compiles the list again, even if the
+    modification time is kept."""
+    compiles = sources[2]
+    load_compatibility_list(sources[0])
+    stat = os.stat(sources[source])
+    with open(sources[source], "a", encoding="UTF-8") as file:
+        file.write("\n")
+    os.utime(sources[source], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    load_compatibility_list(sources[0])
+
+    assert compiles[0] == 2
+
+
+def test_compatibility_cache_version_change(sources, monkeypatch):
+    """Bumping the cache version compiles the list again."""
+    compatibility_list, _, compiles = sources
+    load_compatibility_list(compatibility_list)
+    monkeypatch.setattr(
+        file_handling,
+        "COMPATIBILITY_CACHE_VERSION",
+        file_handling.COMPATIBILITY_CACHE_VERSION + 1,
+    )
+
+    load_compatibility_list(compatibility_list)
+
+    assert compiles[0] == 2
+
+
+def test_parse_hardware_compatibility_list_reads_text(tmp_path):
+    """Only the first four columns are read, all kept as text."""
+    # Arrange
+    compatibility_list = tmp_path / "compatibility.csv"
+    compatibility_list.write_text(
+        COMPATIBILITY_CSV.replace("Needs a license", "Needs a license,9")
+        + "Hanwha,XNV-6080,1.10,0012\n",
+        encoding="UTF-8",
+    )
+
+    # Act
+    models = parse_hardware_compatibility_list(str(compatibility_list))
+
+    # Assert
+    assert models[1:] == [
+        CompatibleModel(
+            "p3367", "Axis Communications", "6.50.5.5", "Needs a license"
+        ),
+        CompatibleModel("xnv-6080", "Hanwha", "1.10", "0012"),
+    ]
+
+
+def test_parse_hardware_compatibility_list_blanks_empty_cells(tmp_path):
+    """Empty cells, such as missing notes, are read as empty strings."""
+    # Arrange
+    compatibility_list = tmp_path / "compatibility.csv"
+    compatibility_list.write_text(
+        COMPATIBILITY_CSV + "Hanwha,XNV-6080,,\n", encoding="UTF-8"
+    )
+
+    # Act
+    models = parse_hardware_compatibility_list(str(compatibility_list))
+
+    # Assert
+    assert [model.notes for model in models] == ["", "Needs a license", ""]
+    assert models[2].minimum_supported_firmware_version == ""
@@ -0,0 +1,61 @@
+"""
+Author: Ian Young
+Purpose: Test the compatibility list lookups using pytest.
+"""
+
+from app import CompatibleModel
+from app.formatting import (
+    count_connector_recommendation,
+    get_camera_lookup,
+    get_verkada_details_frame,
+)
+
+MODELS = [
+    CompatibleModel("m3007", "Axis Communications", "6.50.5.4", ""),
+    CompatibleModel("p3367", "Axis Communications", "6.50.5.5", "Note"),
+    CompatibleModel("m3007", "Hanwha", "1.0", "Duplicate name"),
+]
+
+
+def test_get_camera_lookup_first_model_wins():
+    """The first model listed under a name is the one indexed."""
+    # Act
+    lookup = get_camera_lookup(MODELS)
+
+    # Assert
+    assert list(lookup) == ["m3007", "p3367"]
+    assert lookup["m3007"] is MODELS[0]
+    assert lookup["p3367"] is MODELS[1]
+
+
+def test_get_verkada_details_frame_first_model_wins():
+    """The details frame holds one row per name, from its first model."""
+    # Act
+    details = get_verkada_details_frame(MODELS)
+
+    # Assert
+    assert details.values.tolist() == [
+        ["m3007", "Axis Communications", "6.50.5.4", ""],
+        ["p3367", "Axis Communications", "6.50.5.5", "Note"],
+    ]
+
+
+def test_count_connector_recommendation():
+    """Connectors are counted in the order first recommended."""
+    # Arrange
+    recommendations = [
+        {"name": "CC700-32TB"},
+        {"name": "CC300-4TB"},
+        {"name": "CC700-32TB"},
+    ]
+
+    # Act
+    counts = count_connector_recommendation(recommendations)
+
+    # Assert
+    assert counts == [("CC700-32TB", 2), ("CC300-4TB", 1)]
+
+
+def test_count_connector_recommendation_empty():
+    """No recommendations count to an empty table."""
+    assert not count_connector_recommendation([])
@@ -0,0 +1,109 @@
+"""
+Author: Ian Young
+Purpose: Test the opt-in cache of command line matches using pytest.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+import main_cli
+
+
+@pytest.fixture(name="match_cache")
+def fixture_match_cache(tmp_path, monkeypatch):
+    """
+    Point the match cache at temporary lists and count how many times
+    the cameras are matched.
+
+    Returns:
+        Tuple[str, str, List[int]]: The customer list path, the cache
+            directory and a list holding the match count.
+    """
+    customer_list = tmp_path / "customer.csv"
+    customer_list.write_text("Model\nM3007\n", encoding="UTF-8")
+    compatibility_list = tmp_path / "compatibility.csv"
+    compatibility_list.write_text("Manufacturer,Model\n", encoding="UTF-8")
+    cache_dir = str(tmp_path / "cache")
+
+    matches = [0]
+
+    def match(*_):
+        matches[0] += 1
+        return pd.DataFrame({"name": ["M3007"], "count": [matches[0]]})
+
+    monkeypatch.setattr(
+        main_cli, "COMPATIBILITY_LIST", str(compatibility_list)
+    )
+    monkeypatch.setattr(main_cli, "MATCH_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(main_cli, "get_camera_match", match)
+    monkeypatch.setenv(main_cli.MATCH_CACHE_ENV, "1")
+    return str(customer_list), cache_dir, matches
+
+
+def run_match(customer_list, camera_column=None):
+    """Match the customer list through the cache."""
+    return main_cli._match_cache(  # pylint: disable=protected-access
+        customer_list, None, [], camera_column
+    )
+
+
+def test_match_cache_disabled(match_cache, monkeypatch):
+    """Without the environment variable every run matches again."""
+    customer_list, cache_dir, matches = match_cache
+    monkeypatch.delenv(main_cli.MATCH_CACHE_ENV)
+
+    run_match(customer_list)
+    run_match(customer_list)
+
+    assert matches[0] == 2
+    assert not os.path.exists(cache_dir)
+
+
+def test_match_cache_hit(match_cache):
+    """An unchanged customer list reuses the earlier matches."""
+    customer_list, _, matches = match_cache
+
+    first = run_match(customer_list)
+    second = run_match(customer_list)
+
+    assert matches[0] == 1
+    pd.testing.assert_frame_equal(second, first)
+
+
+def test_match_cache_replaces_stale_entry(match_cache):
+    """Editing the customer list matches again in the same cache file."""
+    customer_list, cache_dir, matches = match_cache
+    run_match(customer_list)
+    stat = os.stat(customer_list)
+    os.utime(customer_list, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    result = run_match(customer_list)
+
+    assert matches[0] == 2
+    assert result["count"].tolist() == [2]
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_match_cache_column_change(match_cache):
+    """Forcing a different model column matches again."""
+    customer_list, _, matches = match_cache
+    run_match(customer_list)
+
+    run_match(customer_list, camera_column=0)
+
+    assert matches[0] == 2
+
+
+def test_match_cache_version_change(match_cache, monkeypatch):
+    """Bumping the cache version matches again."""
+    customer_list, _, matches = match_cache
+    run_match(customer_list)
+    monkeypatch.setattr(
+        main_cli, "MATCH_CACHE_VERSION", main_cli.MATCH_CACHE_VERSION + 1
+    )
+
+    run_match(customer_list)
+
+    assert matches[0] == 2